@@ -0,0 +1,152 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import zlib
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+REQUEST_ID_HEADER = "X-Request-ID"
+REQUEST_ID_ENV = "REQUEST_ID"
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+_STANDARD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Añade el id de correlación de la petición actual a cada registro"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Muestrea los registros por debajo de WARNING; WARNING y superiores siempre pasan.
+
+    La decisión se toma por id de petición, de modo que una petición muestreada
+    conserva todos sus registros en FastAPI y en el servidor MCP.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = max(0.0, min(1.0, rate))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        request_id = getattr(record, "request_id", "-")
+        if request_id == "-":
+            return random.random() < self.rate
+        return (zlib.crc32(request_id.encode()) % 10000) / 10000 < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatea cada registro como una línea JSON, incluyendo los campos de `extra`"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            # Los campos de `extra` no pueden sobrescribir los campos fijos
+            if key not in _STANDARD_ATTRS and key not in entry and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que solo resuelve el mensaje en el hilo que emite el registro.
+
+    Los argumentos `%` se interpolan aquí para capturar su valor en el momento
+    de la llamada; la serialización JSON y la escritura ocurren en el hilo del
+    QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def summarize(payload: Any) -> str:
+    """Resumen barato de un payload para registrar tamaños en lugar de contenidos"""
+    if payload is None:
+        return "None"
+    if isinstance(payload, (str, bytes, bytearray)):
+        return f"{type(payload).__name__}(len={len(payload)})"
+    if isinstance(payload, dict):
+        return f"dict(keys={sorted(str(k) for k in payload)[:10]})"
+    if isinstance(payload, (list, tuple, set)):
+        return f"{type(payload).__name__}(len={len(payload)})"
+    return type(payload).__name__
+
+
+def setup_logging() -> None:
+    """Configura el logging raíz con una cola para sacar el formateo y la E/S del camino crítico.
+
+    Variables de entorno:
+    - LOG_LEVEL: nivel mínimo (por defecto INFO)
+    - LOG_SAMPLE_RATE: fracción de peticiones cuyos registros DEBUG/INFO se emiten (por defecto 1.0)
+
+    Los valores inválidos se sustituyen por el valor por defecto con un aviso.
+
+    Sustituye cualquier handler previo del logger raíz (p. ej. el que instala
+    FastMCP con basicConfig) para que ningún registro se escriba de forma
+    síncrona ni escape al muestreo.
+
+    Los registros se escriben siempre en stderr: en el proceso del servidor MCP
+    stdout es el canal de transporte stdio. Los campos de `extra` se serializan
+    en el hilo del QueueListener, así que deben ser inmutables o resúmenes.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    warnings = []
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    if level not in logging.getLevelNamesMapping():
+        warnings.append(f"LOG_LEVEL inválido {level!r}, usando INFO")
+        level = "INFO"
+    try:
+        sample_rate = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+    except ValueError:
+        warnings.append(f"LOG_SAMPLE_RATE inválido {os.getenv('LOG_SAMPLE_RATE')!r}, usando 1.0")
+        sample_rate = 1.0
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(JsonFormatter())
+
+    queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    for message in warnings:
+        logging.getLogger(__name__).warning(message)
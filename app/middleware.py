@@ -0,0 +1,67 @@
+import logging
+import re
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.logging_config import REQUEST_ID_HEADER, request_id_var
+
+logger = logging.getLogger(__name__)
+
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestContextMiddleware:
+    """Middleware ASGI que asigna un id de correlación a cada petición HTTP.
+
+    Acepta el X-Request-ID del cliente solo si es corto y con caracteres seguros;
+    si no, genera uno nuevo. Lo devuelve en la respuesta y registra la petición
+    una vez enviado el cuerpo completo.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        request_id = incoming if incoming and _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        start = time.perf_counter()
+        status = None
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+            logger.info(
+                "Petición completada",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                },
+            )
+        except Exception:
+            logger.exception(
+                "Petición fallida",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                },
+            )
+            raise
+        finally:
+            request_id_var.reset(token)
@@ -1,15 +1,21 @@
 import asyncio
+import logging
 import sys
 import os
 import json
 import re
+import time
 
 from dotenv import load_dotenv
 load_dotenv()
 
 import google.generativeai as genai
 from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from mcp.client.stdio import get_default_environment, stdio_client
+
+from app.logging_config import REQUEST_ID_ENV, request_id_var, summarize
+
+logger = logging.getLogger(__name__)
 
 def setup_gemini():
     """Configurar Gemini directamente"""
@@ -44,8 +50,13 @@ def process_query_with_gemini(query: str):
     """
     
     try:
+        start = time.perf_counter()
         response = model.generate_content(prompt)
         response_text = response.text.strip()
+        logger.info(
+            "Gemini interpretó la consulta",
+            extra={"duration_ms": round((time.perf_counter() - start) * 1000, 1), "response_len": len(response_text)},
+        )
         
         cleaned_response = re.sub(r'```json\s*\n?(.*?)\n?```', r'\1', response_text, flags=re.DOTALL)
         cleaned_response = re.sub(r'```\s*\n?(.*?)\n?```', r'\1', cleaned_response, flags=re.DOTALL)
@@ -54,6 +65,7 @@ def process_query_with_gemini(query: str):
         return result
         
     except Exception as e:
+        logger.warning("Error procesando consulta con Gemini: %s", e)
         return {"error": f"Error procesando consulta: {str(e)}"}
 
 
@@ -100,9 +112,15 @@ def generate_natural_response(query: str, tool_used: str, results: list) -> str:
     """
     
     try:
+        start = time.perf_counter()
         response = model.generate_content(prompt)
+        logger.info(
+            "Gemini generó la respuesta natural",
+            extra={"duration_ms": round((time.perf_counter() - start) * 1000, 1), "results": len(results)},
+        )
         return response.text.strip()
     except Exception as e:
+        logger.warning("Error generando respuesta natural con Gemini: %s", e)
         return f"Encontré {len(results)} observaciones relacionadas con tu consulta. ¡Aquí tienes los resultados!"
 
 TOOL_NAME_MAP = {
@@ -113,25 +131,33 @@ TOOL_NAME_MAP = {
 
 async def main(prompt):
     """Función principal que usa Gemini directamente"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    server_path = os.path.join(current_dir, "server_mcp.py")
-    server_params = StdioServerParameters(command=sys.executable, args=[server_path])
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # El servidor se lanza como módulo para que pueda importar app.logging_config,
+    # y recibe el id de la petición para correlacionar sus registros.
+    server_env = get_default_environment()
+    server_env[REQUEST_ID_ENV] = request_id_var.get()
+    for name in ("LOG_LEVEL", "LOG_SAMPLE_RATE"):
+        if name in os.environ:
+            server_env[name] = os.environ[name]
+    server_params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "app.services.server_mcp"],
+        env=server_env,
+        cwd=project_root,
+    )
 
-    print("Cliente Observations MCP (usando Gemini directo) iniciado.")
-    print(f"🔧 Usando servidor MCP en: {server_path}")
+    logger.debug("Iniciando servidor MCP", extra={"cwd": project_root})
 
     async with stdio_client(server_params) as (read, write):
-        print("✅ Cliente stdio conectado")
         async with ClientSession(read, write) as session:
-            print("✅ Sesión MCP creada")
             await session.initialize()
-            print("✅ Sesión MCP inicializada")
+            logger.debug("Sesión MCP inicializada")
             
             try:
-                print(f"🤖 Procesando consulta: {prompt}")
+                logger.info("Procesando consulta", extra={"query_len": len(prompt)})
                 
                 gemini_response = process_query_with_gemini(prompt)
-                print(f"🤖 Respuesta de Gemini: {gemini_response}")
+                logger.info("Respuesta de Gemini", extra={"gemini_response": summarize(gemini_response)})
                 
                 if "error" in gemini_response:
                     return gemini_response["error"]
@@ -143,24 +169,32 @@ async def main(prompt):
                     tool_name_on_server = TOOL_NAME_MAP.get(tool_name)
                     
                     if not tool_name_on_server:
-                        print(f"❌ Error: Herramienta desconocida: {tool_name}")
+                        logger.warning("Herramienta desconocida: %s", tool_name)
                         return f"Herramienta desconocida: {tool_name}"
 
-                    print(f"🔧 Llamando a herramienta: {tool_name_on_server} con args: {tool_args}")
+                    logger.info("Llamando a herramienta %s", tool_name_on_server, extra={"tool_args": summarize(tool_args)})
                     
+                    start = time.perf_counter()
                     result = await session.call_tool(tool_name_on_server, arguments=tool_args)
-                    print(f"📥 Resultado del servidor: {result}")
+                    logger.info(
+                        "Resultado del servidor",
+                        extra={
+                            "tool": tool_name_on_server,
+                            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                            "is_error": result.isError,
+                            "content": summarize(result.content),
+                            "structured": summarize((result.structuredContent or {}).get("result")),
+                        },
+                    )
 
                     if result.isError:
-                        print(f"❌ Error del servidor: {result.content}")
+                        logger.warning("Error del servidor en %s", tool_name_on_server)
                         return f"Error del servidor: {result.content}"
                     elif result.structuredContent:
-                        print("✅ Respuesta estructurada obtenida")
                         response_data = result.structuredContent
                         response_data["tool_used"] = tool_name_on_server
                         
                         if "result" in response_data and response_data["result"]:
-                            print("🤖 Generando respuesta natural...")
                             natural_response = generate_natural_response(prompt, tool_name_on_server, response_data["result"])
                             response_data["answer"] = natural_response
                         else:
@@ -168,11 +202,10 @@ async def main(prompt):
                         
                         return response_data
                     else:
-                        print("✅ Respuesta de texto obtenida")
                         return {"data": result.content, "tool_used": tool_name_on_server}
                 else:
                     return "No se pudo procesar la consulta"
                     
             except Exception as e:
-                print(f"❌ Error inesperado: {e}")
+                logger.exception("Error inesperado procesando consulta")
                 return f"Error inesperado: {str(e)}"
@@ -1,11 +1,15 @@
 import google.generativeai as genai
+import logging
 import os
+import time
 import json
 import re
 from typing import Dict, Any
 from PIL import Image
 import io
 
+logger = logging.getLogger(__name__)
+
 class GeminiService:
     
     def __init__(self):
@@ -46,8 +50,17 @@ IMPORTANTE: Asigna porcentajes de confianza reales basados en qué tan seguro es
 
 Si no puedes identificar la especie: {"error": "No se pudo identificar la especie"}"""
             
+            start = time.perf_counter()
             response = self.model.generate_content([prompt, image])
             response_text = response.text.strip()
+            logger.info(
+                "Gemini identificó la imagen",
+                extra={
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                    "image_bytes": len(image_data),
+                    "response_len": len(response_text),
+                },
+            )
             
             return self._parse_response(response_text)
             
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -9,6 +10,10 @@ import asyncpg
 from pydantic import BaseModel, Field
 from mcp.server.fastmcp import FastMCP, Context
 
+from app.logging_config import REQUEST_ID_ENV, request_id_var, setup_logging
+
+logger = logging.getLogger(__name__)
+
 class Species(BaseModel):
     id: int
     common_name: str
@@ -56,10 +61,10 @@ class AppContext:
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
-    print("🔌 Conectando a la base de datos PostgreSQL observations_db...")
-    print(f"   Host: host.docker.internal:5432")
-    print(f"   Database: observations_db")
-    print(f"   User: postgres")
+    logger.info(
+        "Conectando a la base de datos PostgreSQL",
+        extra={"host": "host.docker.internal:5432", "database": "observations_db", "db_user": "postgres"},
+    )
     
     try:
         pool = await asyncpg.create_pool(
@@ -69,15 +74,15 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
             host="host.docker.internal",
             port=5432,
         )
-        print("✅ Pool de conexiones a PostgreSQL observations_db creado.")
+        logger.debug("Pool de conexiones a PostgreSQL observations_db creado")
         yield AppContext(db_pool=pool)
     except Exception as e:
-        print(f"❌ Error conectando a PostgreSQL: {e}")
+        logger.error("Error conectando a PostgreSQL: %s", e)
         raise
     finally:
         if 'pool' in locals() and pool:
             await pool.close()
-            print("🔌 Pool de conexiones a PostgreSQL observations_db cerrado.")
+            logger.debug("Pool de conexiones a PostgreSQL observations_db cerrado")
 
 mcp = FastMCP("ObservationsServer", lifespan=app_lifespan)
 
@@ -86,7 +91,7 @@ async def get_all_observations(ctx: Context) -> List[RegisterWithDetails]:
     """
     Devuelve todas las observaciones con detalles completos.
     """
-    print("🔍 Ejecutando get_all_observations...")
+    logger.debug("Ejecutando get_all_observations")
     pool: asyncpg.Pool = ctx.request_context.lifespan_context.db_pool
     async with pool.acquire() as conn:
         rows = await conn.fetch("""
@@ -132,7 +137,7 @@ async def get_all_observations(ctx: Context) -> List[RegisterWithDetails]:
             )
             result.append(register_detail)
         
-        print(f"📊 Encontradas {len(result)} observaciones totales")
+        logger.info("get_all_observations completada", extra={"results": len(result)})
         return result
 
 @mcp.tool()
@@ -140,11 +145,9 @@ async def get_observations_by_species(name: str, ctx: Context) -> List[RegisterW
     """
     Devuelve todas las observaciones de una especie específica (por nombre común o científico).
     """
-    print(f"🔍 Ejecutando get_observations_by_species con nombre: {name}")
+    logger.debug("Ejecutando get_observations_by_species", extra={"species_name": name})
     pool: asyncpg.Pool = ctx.request_context.lifespan_context.db_pool
     async with pool.acquire() as conn:
-        print(f"📊 Ejecutando query para especies que contengan: {name}")
-        
         rows = await conn.fetch("""
         SELECT 
             r.id, r.user_id, r.species_id, r.location_id, r.description, 
@@ -192,7 +195,7 @@ async def get_observations_by_species(name: str, ctx: Context) -> List[RegisterW
             )
             result.append(register_detail)
         
-        print(f"📊 Encontradas {len(result)} observaciones para especies que contienen '{name}'")
+        logger.info("get_observations_by_species completada", extra={"species_name": name, "results": len(result)})
         return result
 
 @mcp.tool()
@@ -200,7 +203,7 @@ async def get_observations_by_user(user_id: int, ctx: Context) -> List[RegisterW
     """
     Devuelve todas las observaciones de un usuario específico.
     """
-    print(f"🔍 Ejecutando get_observations_by_user con user_id: {user_id}")
+    logger.debug("Ejecutando get_observations_by_user", extra={"user_id": user_id})
     pool: asyncpg.Pool = ctx.request_context.lifespan_context.db_pool
     async with pool.acquire() as conn:
         rows = await conn.fetch("""
@@ -245,9 +248,14 @@ async def get_observations_by_user(user_id: int, ctx: Context) -> List[RegisterW
             )
             result.append(register_detail)
         
-        print(f"📊 Encontradas {len(result)} observaciones para el usuario {user_id}")
+        logger.info("get_observations_by_user completada", extra={"user_id": user_id, "results": len(result)})
         return result
 
+# Debe lanzarse como `python -m app.services.server_mcp` desde la raíz del
+# proyecto para que `app.logging_config` sea importable (así lo hace gemini_client).
 if __name__ == "__main__":
-    print("🚀 Iniciando servidor MCP para observations_db...")
+    # stdout es el transporte stdio de MCP: los registros van a stderr
+    setup_logging()
+    request_id_var.set(os.environ.get(REQUEST_ID_ENV, "-"))
+    logger.debug("Iniciando servidor MCP para observations_db")
     mcp.run()
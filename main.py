@@ -1,7 +1,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.logging_config import REQUEST_ID_HEADER, setup_logging
+from app.middleware import RequestContextMiddleware
 from app.routers import health, species, observations
 
+setup_logging()
+
 app = FastAPI(
     title="Agent-MS",
     description="API para identificar especies animales usando Gemini AI",
@@ -14,8 +18,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[REQUEST_ID_HEADER],
 )
 
+app.add_middleware(RequestContextMiddleware)
+
 app.include_router(health.router)
 app.include_router(species.router)
 app.include_router(observations.router)